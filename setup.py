@@ -0,0 +1,53 @@
+import os
+
+from setuptools import Extension, setup
+from Cython.Build import cythonize
+
+
+COMPILE_ARGS = ["-O3", "-march=native", "-flto"]
+LINK_ARGS = ["-flto"]
+
+# Two-stage PGO build: PGO=generate, run the demos a few hundred times,
+# then rebuild with PGO=use.
+PGO_DIR = "./pgo_data"
+PGO_STAGE = os.environ.get("PGO", "")
+if PGO_STAGE == "generate":
+    COMPILE_ARGS.append(f"-fprofile-generate={PGO_DIR}")
+    LINK_ARGS.append(f"-fprofile-generate={PGO_DIR}")
+elif PGO_STAGE == "use":
+    COMPILE_ARGS.append(f"-fprofile-use={PGO_DIR}")
+    LINK_ARGS.append(f"-fprofile-use={PGO_DIR}")
+
+EXTENSIONS = [
+    Extension(
+        "ex0.space_station",
+        ["ex0/space_station.py"],
+        extra_compile_args=COMPILE_ARGS,
+        extra_link_args=LINK_ARGS,
+    ),
+    Extension(
+        "ex1.alien_contact",
+        ["ex1/alien_contact.py"],
+        extra_compile_args=COMPILE_ARGS,
+        extra_link_args=LINK_ARGS,
+    ),
+    Extension(
+        "ex2.space_crew",
+        ["ex2/space_crew.py"],
+        extra_compile_args=COMPILE_ARGS,
+        extra_link_args=LINK_ARGS,
+    ),
+]
+
+
+setup(
+    name="python09",
+    ext_modules=cythonize(
+        EXTENSIONS,
+        language_level=3,
+        # Keep annotations documentary: Cython must not reject pydantic
+        # model classes (ModelMetaclass instances) passed where a bare
+        # `type` hint appears, e.g. the trusted() helpers.
+        compiler_directives={"annotation_typing": False},
+    ),
+)